@@ -4,22 +4,170 @@ GitHub Contribution Reporter
 A tool to extract and report contribution statistics from GitHub repositories.
 """
 
-import requests
+try:
+    # Drop-in replacement that negotiates HTTP/2, letting concurrent
+    # lookups share a single multiplexed connection
+    import niquests as requests
+except ImportError:
+    import requests
+from urllib3.util.retry import Retry
 import json
+import orjson
 import csv
 import argparse
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+import functools
+import hashlib
+import inspect
+from operator import attrgetter
+import os
+import sqlite3
+import threading
 import time
 import sys
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'github-contribution-reporter', 'etags.sqlite')
+
+# Contributor fields written to CSV reports, and their column headers
+CSV_FIELDS = ['username', 'name', 'contributions', 'total_commits', 'additions', 'deletions', 'profile_url', 'type']
+CSV_HEADER = ['Username', 'Name', 'Contributions', 'Total Commits', 'Additions', 'Deletions', 'Profile URL', 'Type']
+
+
+class ETagCache:
+    """Persistent store of ETags and response bodies for conditional requests."""
+
+    def __init__(self, path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): Path to the SQLite database file
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS etags (key TEXT PRIMARY KEY, etag TEXT, body BLOB)')
+        self.conn.commit()
+
+    def get(self, key):
+        """Return the cached (etag, body) pair for key, or None."""
+        with self.lock:
+            return self.conn.execute('SELECT etag, body FROM etags WHERE key = ?', (key,)).fetchone()
+
+    def set(self, key, etag, body):
+        """Store the ETag and raw response body for key."""
+        with self.lock:
+            self.conn.execute('INSERT OR REPLACE INTO etags (key, etag, body) VALUES (?, ?, ?)', (key, etag, body))
+            self.conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+
+class MemoryCache:
+    """In-process LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, max_size=1000):
+        """
+        Create an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entries before the least recently used is evicted
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """Store value under key for ttl seconds."""
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        """Remove key from the cache if present."""
+        with self.lock:
+            self.entries.pop(key, None)
+
+
+class PartialList(list):
+    """List result known to be missing items; cached() never stores it."""
+
+
+def cached(ttl):
+    """
+    Cache a reporter method's non-empty, complete results in the reporter's memory cache.
+
+    Args:
+        ttl (int): Seconds before a cached result expires
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            # Bind to the signature so positional and keyword calls share a key
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__, bound.args[1:])
+            value = self.memory_cache.get(key)
+            if value is None:
+                value = func(*bound.args, **bound.kwargs)
+                if value and not isinstance(value, PartialList):
+                    self.memory_cache.set(key, value, ttl)
+            return value
+        return wrapper
+    return decorator
+
+
+@dataclass(slots=True)
+class Contributor:
+    """Contribution statistics for a single repository contributor."""
+
+    username: str
+    name: str = ''
+    contributions: int = 0
+    profile_url: str = ''
+    avatar_url: str = ''
+    type: str = 'User'
+    total_commits: int = 0
+    additions: int = 0
+    deletions: int = 0
+
 
 class GitHubContributionReporter:
-    def __init__(self, github_token=None):
+    __slots__ = ('base_url', 'headers', 'session', 'memory_cache', 'etag_cache')
+
+    def __init__(self, github_token=None, cache_path=DEFAULT_CACHE_PATH):
         """
         Initialize the reporter with optional GitHub token for higher rate limits.
 
         Args:
             github_token (str): GitHub personal access token (optional)
+            cache_path (str): ETag cache database path, or None to disable caching
         """
         self.base_url = "https://api.github.com"
         self.headers = {
@@ -30,6 +178,34 @@ class GitHubContributionReporter:
         if github_token:
             self.headers['Authorization'] = f'token {github_token}'
 
+        # Reuse one pooled session so every call shares a warm TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=5, backoff_factor=1.0, backoff_jitter=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504], respect_retry_after_header=True,
+                      raise_on_status=False)
+        self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry))
+
+        self.memory_cache = MemoryCache()
+        self.etag_cache = None
+        if cache_path:
+            try:
+                self.etag_cache = ETagCache(cache_path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: could not open cache at {cache_path}: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release pooled HTTP connections and the ETag cache."""
+        self.session.close()
+        if self.etag_cache:
+            self.etag_cache.close()
+
     def parse_repo_url(self, repo_url):
         """
         Parse GitHub repository URL to extract owner and repo name.
@@ -67,30 +243,126 @@ class GitHubContributionReporter:
         Returns:
             dict: API response data
         """
+        return self._request(endpoint, params)[1]
+
+    def _request(self, endpoint, params=None):
+        """
+        Make API request and return the response alongside its decoded body.
+
+        Responses carrying an ETag are cached on disk and revalidated with
+        If-None-Match; a 304 reply is served from the cache and does not
+        count against the rate limit.
+
+        Args:
+            endpoint (str): API endpoint
+            params (dict): Query parameters
+
+        Returns:
+            tuple: (response, data), or (None, None) if the request failed
+        """
         url = f"{self.base_url}{endpoint}"
+        key = hashlib.sha1((endpoint + json.dumps(params, sort_keys=True)).encode()).hexdigest()
+        cached = None
+        if self.etag_cache:
+            try:
+                cached = self.etag_cache.get(key)
+            except sqlite3.Error as e:
+                print(f"Warning: could not read ETag cache: {e}")
+        headers = {'If-None-Match': cached[0]} if cached else None
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            # When a rate limit rejects the request, wait it out and send the request again
+            for _ in range(3):
+                response = self.session.get(url, params=params, headers=headers, timeout=30)
+                if not self._wait_for_rate_limit(response):
+                    break
 
-            # Handle rate limiting
-            if response.status_code == 403 and 'rate limit' in response.text.lower():
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                wait_time = max(reset_time - int(time.time()), 0) + 60
-                print(f"Rate limit exceeded. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
-                response = requests.get(url, headers=self.headers, params=params)
+            if response.status_code == 304 and cached:
+                return response, orjson.loads(cached[1])
+
+            # 202 Accepted means the data is still being prepared
+            if response.status_code == 202:
+                return response, None
 
             response.raise_for_status()
-            return response.json()
 
-        except requests.exceptions.RequestException as e:
+            etag = response.headers.get('ETag')
+            if self.etag_cache and etag and response.status_code == 200:
+                try:
+                    self.etag_cache.set(key, etag, response.content)
+                except sqlite3.Error as e:
+                    print(f"Warning: could not update ETag cache: {e}")
+
+            return response, orjson.loads(response.content)
+
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error making API request: {e}")
+            return None, None
+
+    def _header_int(self, response, name):
+        """
+        Read an integer response header.
+
+        Args:
+            response: Response to read the header from
+            name (str): Header name
+
+        Returns:
+            int: Header value, or None if it is missing or malformed
+        """
+        try:
+            return int(response.headers.get(name))
+        except (TypeError, ValueError):
             return None
 
+    def _wait_for_rate_limit(self, response):
+        """
+        Sleep as required by GitHub's primary and secondary rate limits.
+
+        Rejected requests wait for Retry-After, or until X-RateLimit-Reset when
+        the primary limit is used up, or 60 seconds otherwise. Successful
+        responses wait for the reset when fewer than 2 requests remain.
+
+        Args:
+            response: Response whose rate limit headers should be checked
+
+        Returns:
+            bool: True if the request was rejected and should be sent again
+        """
+        remaining = self._header_int(response, 'X-RateLimit-Remaining')
+        reset_time = self._header_int(response, 'X-RateLimit-Reset')
+        retry_after = self._header_int(response, 'Retry-After')
+
+        if response.status_code in (403, 429):
+            if retry_after is not None:
+                wait_time = retry_after
+            elif remaining == 0 and reset_time is not None:
+                wait_time = max(reset_time - int(time.time()), 0) + 1
+            elif response.status_code == 429 or 'rate limit' in response.text.lower():
+                wait_time = 60
+            else:
+                # A plain permission error, not a rate limit
+                return False
+
+            print(f"Rate limit exceeded. Waiting {wait_time} seconds...")
+            time.sleep(wait_time)
+            return True
+
+        if remaining is not None and remaining < 2 and reset_time is not None:
+            wait_time = max(reset_time - int(time.time()), 0) + 1
+            print(f"Rate limit nearly exhausted. Waiting {wait_time} seconds...")
+            time.sleep(wait_time)
+
+        return False
+
+    @cached(ttl=600)
     def get_contributors(self, owner, repo):
         """
         Get list of contributors with their contribution counts.
 
+        The first page's Link header gives the total page count, so the
+        remaining pages are fetched concurrently.
+
         Args:
             owner (str): Repository owner
             repo (str): Repository name
@@ -100,23 +372,56 @@ class GitHubContributionReporter:
         """
         print(f"Fetching contributors for {owner}/{repo}...")
 
-        contributors = []
-        page = 1
+        endpoint = f"/repos/{owner}/{repo}/contributors"
         per_page = 100
 
-        while True:
-            endpoint = f"/repos/{owner}/{repo}/contributors"
+        def fetch_page(page):
             params = {
                 'page': page,
                 'per_page': per_page,
                 'anon': 'false'  # Exclude anonymous contributors
             }
+            return self._request(endpoint, params)
+
+        response, data = fetch_page(1)
+        if not isinstance(data, list) or len(data) == 0:
+            return []
+
+        contributors = list(data)
+        if len(data) < per_page:
+            return contributors
+
+        last_url = response.links.get('last', {}).get('url')
+        if last_url:
+            last_page = int(parse_qs(urlparse(last_url).query).get('page', ['1'])[0])
+            page_numbers = range(2, last_page + 1)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                page_data = dict(zip(page_numbers, (data for _, data in executor.map(fetch_page, page_numbers))))
+
+            # Give failed pages one more sequential attempt
+            for page in page_numbers:
+                if not isinstance(page_data[page], list):
+                    page_data[page] = fetch_page(page)[1]
+
+            missing = [page for page in page_numbers if not isinstance(page_data[page], list)]
+            for page in page_numbers:
+                if page not in missing:
+                    contributors.extend(page_data[page])
+
+            if missing:
+                print(f"Warning: could not fetch contributor pages {missing}; contributor list is incomplete")
+                return PartialList(contributors)
+            return contributors
+
+        # No page count available; walk the remaining pages in order
+        page = 2
+        while True:
+            _, data = fetch_page(page)
+            if not isinstance(data, list):
+                print(f"Warning: could not fetch contributor page {page}; contributor list is incomplete")
+                return PartialList(contributors)
 
-            data = self.make_request(endpoint, params)
-            if not data:
-                break
-
-            if not isinstance(data, list) or len(data) == 0:
+            if len(data) == 0:
                 break
 
             contributors.extend(data)
@@ -125,10 +430,10 @@ class GitHubContributionReporter:
                 break
 
             page += 1
-            time.sleep(0.1)  # Small delay to be respectful
 
         return contributors
 
+    @cached(ttl=600)
     def get_commit_stats(self, owner, repo):
         """
         Get commit statistics for the repository.
@@ -138,26 +443,24 @@ class GitHubContributionReporter:
             repo (str): Repository name
 
         Returns:
-            dict: Commit statistics
+            list: Per-author commit statistics
         """
         print(f"Fetching commit statistics for {owner}/{repo}...")
 
         endpoint = f"/repos/{owner}/{repo}/stats/contributors"
-        data = self.make_request(endpoint)
-
-        if not data:
-            return {}
+        response, data = self._request(endpoint)
 
-        # GitHub may return 202 while computing stats
-        retries = 3
-        while isinstance(data, dict) and data is not None and data.get('message') == 'Statistics not ready' and retries > 0:
-            print("Statistics are being computed by GitHub, waiting...")
-            time.sleep(5)
-            data = self.make_request(endpoint)
-            retries -= 1
+        # GitHub returns 202 while computing stats; back off until they are ready
+        for delay in (1, 2, 4, 8, 16, 30):
+            if response is None or response.status_code != 202:
+                break
+            print(f"Statistics are being computed by GitHub, retrying in {delay}s...")
+            time.sleep(delay)
+            response, data = self._request(endpoint)
 
         return data if isinstance(data, list) else []
 
+    @cached(ttl=86400)
     def get_repo_info(self, owner, repo):
         """
         Get basic repository information.
@@ -172,7 +475,81 @@ class GitHubContributionReporter:
         endpoint = f"/repos/{owner}/{repo}"
         return self.make_request(endpoint)
 
-    def generate_report(self, repo_url, output_format='csv', output_file=None):
+    @cached(ttl=86400)
+    def _get_user(self, username):
+        """
+        Get a single user's profile.
+
+        Args:
+            username (str): GitHub login
+
+        Returns:
+            dict: User profile data
+        """
+        return self.make_request(f"/users/{username}")
+
+    def _fetch_users(self, usernames, max_workers=10):
+        """
+        Fetch full names for many users concurrently.
+
+        Args:
+            usernames (list): GitHub logins
+            max_workers (int): Maximum number of concurrent requests
+
+        Returns:
+            dict: Mapping of login to full name
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            profiles = executor.map(self._get_user, usernames)
+            return {
+                username: (user_info.get('name') or '') if isinstance(user_info, dict) else ''
+                for username, user_info in zip(usernames, profiles)
+            }
+
+    def get_users_graphql(self, usernames, chunk_size=100):
+        """
+        Fetch full names for many users with batched GraphQL queries.
+
+        The GraphQL API requires authentication, so this is only used when a
+        token was provided. Chunks that fail fall back to the REST lookups.
+
+        Args:
+            usernames (list): GitHub logins
+            chunk_size (int): Number of logins resolved per query
+
+        Returns:
+            dict: Mapping of login to full name
+        """
+        names = {}
+
+        for start in range(0, len(usernames), chunk_size):
+            chunk = usernames[start:start + chunk_size]
+            variables = {f"l{i}": login for i, login in enumerate(chunk)}
+            params = ", ".join(f"$l{i}: String!" for i in range(len(chunk)))
+            fields = " ".join(f"u{i}: user(login: $l{i}) {{ name }}" for i in range(len(chunk)))
+            query = f"query({params}) {{ {fields} }}"
+
+            try:
+                response = self.session.post(f"{self.base_url}/graphql",
+                                             json={'query': query, 'variables': variables}, timeout=30)
+                self._wait_for_rate_limit(response)
+                response.raise_for_status()
+                data = orjson.loads(response.content).get('data')
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                print(f"Error making GraphQL request: {e}")
+                data = None
+
+            if not isinstance(data, dict):
+                names.update(self._fetch_users(chunk))
+                continue
+
+            for i, login in enumerate(chunk):
+                user = data.get(f"u{i}")
+                names[login] = (user.get('name') or '') if isinstance(user, dict) else ''
+
+        return names
+
+    def generate_report(self, repo_url, output_format='csv', output_file=None, refresh=False):
         """
         Generate contribution report for a repository.
 
@@ -180,11 +557,18 @@ class GitHubContributionReporter:
             repo_url (str): GitHub repository URL
             output_format (str): Output format ('csv', 'json', or 'console')
             output_file (str): Output file path (optional)
+            refresh (bool): Ignore in-memory cached repository data and contributor names
         """
+        now = datetime.now()
+
         try:
             owner, repo = self.parse_repo_url(repo_url)
             print(f"Analyzing repository: {owner}/{repo}")
 
+            if refresh:
+                for method in ('get_repo_info', 'get_contributors', 'get_commit_stats'):
+                    self.memory_cache.delete((method, (owner, repo)))
+
             # Get repository info
             repo_info = self.get_repo_info(owner, repo)
             if not repo_info:
@@ -200,6 +584,23 @@ class GitHubContributionReporter:
             # Get detailed commit stats
             commit_stats = self.get_commit_stats(owner, repo)
 
+            # Fetch full names for all contributors up front
+            usernames = [c.get('login', 'Unknown') for c in contributors if c is not None]
+            if refresh:
+                for username in usernames:
+                    self.memory_cache.delete(('_get_user', (username,)))
+            if 'Authorization' in self.headers:
+                names = self.get_users_graphql(usernames)
+            else:
+                names = self._fetch_users(usernames)
+
+            # Index commit stats by author login
+            stats_by_login = {}
+            for stat in commit_stats:
+                author = stat.get('author') if isinstance(stat, dict) else None
+                if isinstance(author, dict) and author.get('login'):
+                    stats_by_login[author['login']] = stat
+
             # Merge data
             contribution_data = []
             for contributor in contributors:
@@ -207,100 +608,86 @@ class GitHubContributionReporter:
                     continue
                 username = contributor.get('login', 'Unknown')
 
-                # Fetch user's full name
-                user_info = self.make_request(f"/users/{username}")
-                full_name = user_info.get('name') if user_info and isinstance(user_info, dict) else ''
-
-                contrib_data = {
-                    'username': username,
-                    'name': full_name,
-                    'contributions': contributor.get('contributions', 0) if contributor else 0,
-                    'profile_url': contributor.get('html_url', '') if contributor else '',
-                    'avatar_url': contributor.get('avatar_url', '') if contributor else '',
-                    'type': contributor.get('type', 'User') if contributor else 'User',
-                    'total_commits': 0,
-                    'additions': 0,
-                    'deletions': 0
-                }
+                contrib_data = Contributor(
+                    username=username,
+                    name=names.get(username, ''),
+                    contributions=contributor.get('contributions', 0),
+                    profile_url=contributor.get('html_url', ''),
+                    avatar_url=contributor.get('avatar_url', ''),
+                    type=contributor.get('type', 'User')
+                )
 
                 # Add detailed stats if available
-                for stat in commit_stats:
-                    if stat and isinstance(stat, dict) and stat.get('author', {}) and isinstance(stat.get('author', {}), dict) and stat.get('author', {}).get('login') == username:
-                        contrib_data['total_commits'] = sum(week.get('c', 0) for week in stat.get('weeks', []) if week)
-                        contrib_data['additions'] = sum(week.get('a', 0) for week in stat.get('weeks', []) if week)
-                        contrib_data['deletions'] = sum(week.get('d', 0) for week in stat.get('weeks', []) if week)
-                        break
+                stat = stats_by_login.get(username)
+                if stat:
+                    commits = additions = deletions = 0
+                    for week in stat.get('weeks') or ():
+                        if week:
+                            commits += week.get('c', 0)
+                            additions += week.get('a', 0)
+                            deletions += week.get('d', 0)
+                    contrib_data.total_commits = commits
+                    contrib_data.additions = additions
+                    contrib_data.deletions = deletions
 
                 contribution_data.append(contrib_data)
 
             # Sort by contributions (descending)
-            contribution_data.sort(key=lambda x: x['contributions'], reverse=True)
+            contribution_data.sort(key=attrgetter('contributions'), reverse=True)
 
             # Generate report
             report_data = {
                 'repository': {
-                    'name': repo_info.get('full_name', f"{owner}/{repo}") if repo_info else f"{owner}/{repo}",
-                    'description': repo_info.get('description', '') if repo_info else '',
-                    'url': repo_info.get('html_url', '') if repo_info else '',
-                    'stars': repo_info.get('stargazers_count', 0) if repo_info else 0,
-                    'forks': repo_info.get('forks_count', 0) if repo_info else 0,
-                    'language': repo_info.get('language', 'Unknown') if repo_info else 'Unknown',
-                    'created_at': repo_info.get('created_at', '') if repo_info else '',
-                    'updated_at': repo_info.get('updated_at', '') if repo_info else ''
+                    'name': repo_info.get('full_name', f"{owner}/{repo}"),
+                    'description': repo_info.get('description', ''),
+                    'url': repo_info.get('html_url', ''),
+                    'stars': repo_info.get('stargazers_count', 0),
+                    'forks': repo_info.get('forks_count', 0),
+                    'language': repo_info.get('language', 'Unknown'),
+                    'created_at': repo_info.get('created_at', ''),
+                    'updated_at': repo_info.get('updated_at', '')
                 },
                 'summary': {
                     'total_contributors': len(contribution_data),
-                    'total_contributions': sum(c['contributions'] for c in contribution_data),
-                    'report_generated': datetime.now().isoformat()
+                    'total_contributions': sum(c.contributions for c in contribution_data),
+                    'report_generated': now.isoformat()
                 },
                 'contributors': contribution_data
             }
 
             # Output report
             if output_format.lower() == 'json':
-                self._output_json(report_data, output_file)
+                self._output_json(report_data, output_file, now)
             elif output_format.lower() == 'csv':
-                self._output_csv(report_data, output_file)
+                self._output_csv(report_data, output_file, now)
             else:
                 self._output_console(report_data)
 
         except Exception as e:
             print(f"Error generating report: {e}")
 
-    def _output_json(self, data, output_file):
+    def _output_json(self, data, output_file, now):
         """Output report as JSON."""
-        filename = output_file or f"contribution_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = output_file or f"contribution_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         print(f"Report saved to: {filename}")
 
-    def _output_csv(self, data, output_file):
+    def _output_csv(self, data, output_file, now):
         """Output report as CSV."""
-        filename = output_file or f"contribution_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = output_file or f"contribution_report_{now.strftime('%Y%m%d_%H%M%S')}.csv"
 
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
 
             # Write header
-            writer.writerow([
-                'Username', 'Name', 'Contributions', 'Total Commits',
-                'Additions', 'Deletions', 'Profile URL', 'Type'
-            ])
-
-            # Write contributor data
-            for contrib in data['contributors']:
-                writer.writerow([
-                    contrib.get('username', ''),
-                    contrib.get('name', ''),
-                    contrib.get('contributions', 0),
-                    contrib.get('total_commits', ''),
-                    contrib.get('additions', ''),
-                    contrib.get('deletions', ''),
-                    contrib.get('profile_url', ''),
-                    contrib.get('type', '')
-                ])
+            writer.writerow(CSV_HEADER)
+
+            # Write contributor data; attrgetter builds each row tuple in C
+            row = attrgetter(*CSV_FIELDS)
+            writer.writerows(map(row, data['contributors']))
 
         print(f"Report saved to: {filename}")
 
@@ -309,26 +696,30 @@ class GitHubContributionReporter:
         repo = data['repository']
         summary = data['summary']
 
-        print("\n" + "="*80)
-        print(f"CONTRIBUTION REPORT: {repo['name']}")
-        print("="*80)
-        print(f"Description: {repo['description']}")
-        print(f"URL: {repo['url']}")
-        print(f"Stars: {repo['stars']} | Forks: {repo['forks']} | Language: {repo['language']}")
-        print(f"Created: {repo['created_at'][:10]} | Updated: {repo['updated_at'][:10]}")
-        print(f"\nTotal Contributors: {summary['total_contributors']}")
-        print(f"Total Contributions: {summary['total_contributions']}")
-        print(f"Report Generated: {summary['report_generated'][:19]}")
-
-        print("\n" + "-"*80)
-        print("TOP CONTRIBUTORS:")
-        print("-"*80)
-        print(f"{'Rank':<4} {'Username':<20} {'Name':<25} {'Contributions':<12} {'Type':<8}")
-        print("-"*80)
+        lines = [
+            "\n" + "="*80,
+            f"CONTRIBUTION REPORT: {repo['name']}",
+            "="*80,
+            f"Description: {repo['description']}",
+            f"URL: {repo['url']}",
+            f"Stars: {repo['stars']} | Forks: {repo['forks']} | Language: {repo['language']}",
+            f"Created: {repo['created_at'][:10]} | Updated: {repo['updated_at'][:10]}",
+            f"\nTotal Contributors: {summary['total_contributors']}",
+            f"Total Contributions: {summary['total_contributions']}",
+            f"Report Generated: {summary['report_generated'][:19]}",
+            "\n" + "-"*80,
+            "TOP CONTRIBUTORS:",
+            "-"*80,
+            f"{'Rank':<4} {'Username':<20} {'Name':<25} {'Contributions':<12} {'Type':<8}",
+            "-"*80
+        ]
 
         for i, contrib in enumerate(data['contributors'][:20], 1):  # Top 20
-            print(f"{i:<4} {contrib['username'][:19]:<20} {contrib.get('name', '')[:24]:<25} "
-                  f"{contrib['contributions']:<12} {contrib.get('type', 'User'):<8}")
+            lines.append(f"{i:<4} {contrib.username[:19]:<20} {contrib.name[:24]:<25} "
+                         f"{contrib.contributions:<12} {contrib.type:<8}")
+
+        # Emit the whole report with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -338,14 +729,14 @@ def main():
     parser.add_argument('-f', '--format', choices=['csv', 'json', 'console'],
                        default='console', help='Output format (default: console)')
     parser.add_argument('-o', '--output', help='Output file path (optional)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the on-disk ETag cache')
 
     args = parser.parse_args()
 
-    # Create reporter instance
-    reporter = GitHubContributionReporter(args.token)
-
-    # Generate report
-    reporter.generate_report(args.repo_url, args.format, args.output)
+    # Create reporter instance and generate report
+    cache_path = None if args.no_cache else DEFAULT_CACHE_PATH
+    with GitHubContributionReporter(args.token, cache_path) as reporter:
+        reporter.generate_report(args.repo_url, args.format, args.output)
 
 
 if __name__ == "__main__":